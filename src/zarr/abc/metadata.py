@@ -11,7 +11,7 @@ from dataclasses import dataclass, fields
 from zarr.common import JSON
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metadata:
     def to_dict(self) -> JSON:
         """
@@ -101,7 +101,7 @@ class AsyncArray:
         order: Literal["C", "F"] | None = None,
     ):
         metadata_parsed = parse_array_metadata(metadata)
-        order_parsed = parse_indexing_order(order or config.get("array.order"))
+        order_parsed = parse_indexing_order(order or config.cached_get("array.order"))
 
         object.__setattr__(self, "metadata", metadata_parsed)
         object.__setattr__(self, "store_path", store_path)
@@ -6,7 +6,8 @@ from abc import abstractmethod
 from collections.abc import Iterator
 from dataclasses import dataclass
 from functools import reduce
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
 
 from zarr.abc.metadata import Metadata
 from zarr.common import (
@@ -21,6 +22,8 @@ from zarr.indexing import ceildiv
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+_interned_chunk_grids: WeakValueDictionary[tuple[Any, ...], ChunkGrid] = WeakValueDictionary()
+
 
 @dataclass(frozen=True)
 class ChunkGrid(Metadata):
@@ -31,7 +34,11 @@ class ChunkGrid(Metadata):
 
         name_parsed, _ = parse_named_configuration(data)
         if name_parsed == "regular":
-            return RegularChunkGrid._from_dict(data)
+            chunk_grid = RegularChunkGrid._from_dict(data)
+            # share one instance between all arrays with the same chunk grid
+            return _interned_chunk_grids.setdefault(
+                (type(chunk_grid), chunk_grid.chunk_shape), chunk_grid
+            )
         raise ValueError(f"Unknown chunk grid. Got {name_parsed}.")
 
     @abstractmethod
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
+from weakref import WeakValueDictionary
 
 from zarr.abc.metadata import Metadata
 from zarr.common import (
@@ -16,6 +17,10 @@ if TYPE_CHECKING:
 
 SeparatorLiteral = Literal[".", "/"]
 
+_interned_chunk_key_encodings: WeakValueDictionary[tuple[Any, ...], ChunkKeyEncoding] = (
+    WeakValueDictionary()
+)
+
 
 def parse_separator(data: JSON) -> SeparatorLiteral:
     if data not in (".", "/"):
@@ -39,11 +44,17 @@ class ChunkKeyEncoding(Metadata):
             return data
 
         name_parsed, configuration_parsed = parse_named_configuration(data)
+        chunk_key_encoding: ChunkKeyEncoding
         if name_parsed == "default":
-            return DefaultChunkKeyEncoding(**configuration_parsed)  # type: ignore[arg-type]
-        if name_parsed == "v2":
-            return V2ChunkKeyEncoding(**configuration_parsed)  # type: ignore[arg-type]
-        raise ValueError(f"Unknown chunk key encoding. Got {name_parsed}.")
+            chunk_key_encoding = DefaultChunkKeyEncoding(**configuration_parsed)  # type: ignore[arg-type]
+        elif name_parsed == "v2":
+            chunk_key_encoding = V2ChunkKeyEncoding(**configuration_parsed)  # type: ignore[arg-type]
+        else:
+            raise ValueError(f"Unknown chunk key encoding. Got {name_parsed}.")
+        # share one instance between all arrays with the same chunk key encoding
+        return _interned_chunk_key_encodings.setdefault(
+            (type(chunk_key_encoding), chunk_key_encoding.separator), chunk_key_encoding
+        )
 
     def to_dict(self) -> dict[str, JSON]:
         return {"name": self.name, "configuration": {"separator": self.separator}}
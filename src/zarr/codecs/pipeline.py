@@ -99,7 +99,7 @@ class BatchedCodecPipeline(CodecPipeline):
             array_array_codecs=array_array_codecs,
             array_bytes_codec=array_bytes_codec,
             bytes_bytes_codecs=bytes_bytes_codecs,
-            batch_size=batch_size or config.get("codec_pipeline.batch_size"),
+            batch_size=batch_size or config.cached_get("codec_pipeline.batch_size"),
         )
 
     @property
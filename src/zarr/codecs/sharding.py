@@ -4,7 +4,6 @@ from collections.abc import Iterable, Mapping, MutableMapping
 from dataclasses import dataclass, field, replace
 from enum import Enum
 from functools import lru_cache
-from operator import itemgetter
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 import numpy as np
@@ -122,24 +121,19 @@ class _ShardIndex(NamedTuple):
             )
 
     def is_dense(self, chunk_byte_length: int) -> bool:
-        sorted_offsets_and_lengths = sorted(
-            [
-                (offset, length)
-                for offset, length in self.offsets_and_lengths
-                if offset != MAX_UINT_64
-            ],
-            key=itemgetter(0),
-        )
+        # flat (n_chunks, 2) view of the non-empty entries
+        offsets_and_lengths = self.offsets_and_lengths.reshape(-1, 2)
+        offsets_and_lengths = offsets_and_lengths[offsets_and_lengths[:, 0] != MAX_UINT_64]
+        offsets = offsets_and_lengths[:, 0]
+        lengths = offsets_and_lengths[:, 1]
 
         # Are all non-empty offsets unique?
-        if len(
-            set(offset for offset, _ in sorted_offsets_and_lengths if offset != MAX_UINT_64)
-        ) != len(sorted_offsets_and_lengths):
+        if len(np.unique(offsets)) != len(offsets):
             return False
 
-        return all(
-            offset % chunk_byte_length == 0 and length == chunk_byte_length
-            for offset, length in sorted_offsets_and_lengths
+        return bool(
+            np.all(offsets % np.uint64(chunk_byte_length) == 0)
+            and np.all(lengths == chunk_byte_length)
         )
 
     @classmethod
@@ -347,7 +341,8 @@ class ShardingCodec(
     def evolve_from_array_spec(self, array_spec: ArraySpec) -> Self:
         shard_spec = self._get_chunk_spec(array_spec)
         evolved_codecs = tuple(c.evolve_from_array_spec(array_spec=shard_spec) for c in self.codecs)
-        if evolved_codecs != self.codecs:
+        # codecs return themselves when there is nothing to evolve
+        if any(e is not c for e, c in zip(evolved_codecs, self.codecs, strict=True)):
             return replace(self, codecs=evolved_codecs)
         return self
 
@@ -134,6 +134,9 @@ def parse_named_configuration(
 
 
 def parse_shapelike(data: int | Iterable[int]) -> tuple[int, ...]:
+    # fast path for shapes that are already tuples of non-negative ints
+    if type(data) is tuple and all(type(v) is int and v >= 0 for v in data):
+        return data
     if isinstance(data, int):
         if data < 0:
             raise ValueError(f"Expected a non-negative integer. Got {data} instead")
@@ -155,6 +158,16 @@ def parse_shapelike(data: int | Iterable[int]) -> tuple[int, ...]:
 
 def parse_dtype(data: npt.DTypeLike) -> np.dtype[Any]:
     # todo: real validation
+    try:
+        hash(data)
+    except TypeError:
+        # unhashable input, e.g. a structured dtype given as a list of fields
+        return np.dtype(data)
+    return _parse_dtype_cached(data)  # type: ignore[arg-type]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_dtype_cached(data: npt.DTypeLike) -> np.dtype[Any]:
     return np.dtype(data)
 
 
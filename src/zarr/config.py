@@ -1,21 +1,93 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any, Literal, cast
 
 from donfig import Config
+from donfig.config_obj import ConfigSet
 
-config = Config(
-    "zarr",
-    defaults=[
+
+class _ConfigSet(ConfigSet):  # type: ignore[misc]
+    """`ConfigSet` that notifies its owner when the temporary values are reverted."""
+
+    def __init__(self, on_exit: Callable[[], None], *args: Any, **kwargs: Any) -> None:
+        self._on_exit = on_exit
+        super().__init__(*args, **kwargs)
+
+    def __exit__(self, type: Any, value: Any, traceback: Any) -> None:
+        super().__exit__(type, value, traceback)
+        self._on_exit()
+
+
+class ZarrConfig(Config):  # type: ignore[misc]
+    """
+    Donfig `Config` with a lookup cache for hot keys.
+
+    `cached_get` memoizes resolved values; the cache is dropped whenever the configuration
+    is changed through this object.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._cache: dict[str, Any] = {}
+        super().__init__(*args, **kwargs)
+
+    def cached_get(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self.get(key)
+            return value
+
+    def set(self, arg: Mapping[str, Any] | None = None, **kwargs: Any) -> ConfigSet:
+        config_set = _ConfigSet(
+            self._cache.clear, self.config, self.config_lock, self.deprecations, arg=arg, **kwargs
+        )
+        self._cache.clear()
+        return config_set
+
+    def clear(self) -> None:
+        super().clear()
+        self._cache.clear()
+
+    def update(self, new: Mapping[str, Any], priority: str = "new") -> None:
+        super().update(new, priority=priority)
+        self._cache.clear()
+
+    def update_defaults(self, new: Mapping[str, Any]) -> None:
+        super().update_defaults(new)
+        self._cache.clear()
+
+    def refresh(self, **kwargs: Any) -> None:
+        super().refresh(**kwargs)
+        self._cache.clear()
+
+    def merge(self, *dicts: Mapping[str, Any]) -> None:
+        # donfig's `Config.merge` passes `dicts` on without unpacking it; merging them in
+        # order is the same as updating with each of them
+        for d in dicts:
+            self.update(d)
+
+    def expand_environment_variables(self) -> None:
+        super().expand_environment_variables()
+        self._cache.clear()
+
+
+# read-only at every level so that `refresh` always restores the same values; donfig copies
+# nested mappings into plain dicts when applying them
+_DEFAULTS: tuple[Mapping[str, Any], ...] = (
+    MappingProxyType(
         {
-            "array": {"order": "C"},
-            "async": {"concurrency": None, "timeout": None},
-            "codec_pipeline": {"batch_size": 1},
+            "array": MappingProxyType({"order": "C"}),
+            "async": MappingProxyType({"concurrency": None, "timeout": None}),
+            "codec_pipeline": MappingProxyType({"batch_size": 1}),
             "json_indent": 2,
         }
-    ],
+    ),
 )
 
+config = ZarrConfig("zarr", defaults=list(_DEFAULTS))
+
 
 def parse_indexing_order(data: Any) -> Literal["C", "F"]:
     if data in ("C", "F"):
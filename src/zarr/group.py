@@ -80,7 +80,7 @@ class GroupMetadata(Metadata):
     node_type: Literal["group"] = field(default="group", init=False)
 
     def to_buffer_dict(self) -> dict[str, Buffer]:
-        json_indent = config.get("json_indent")
+        json_indent = config.cached_get("json_indent")
         if self.zarr_format == 3:
             return {
                 ZARR_JSON: Buffer.from_bytes(
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+import math
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Literal
@@ -19,9 +20,15 @@ from zarr.codecs.registry import get_codec_class
 from zarr.config import config
 
 if TYPE_CHECKING:
+    import numcodecs.abc
     from typing_extensions import Self
 
-import numcodecs.abc
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
 
 from zarr.array_spec import ArraySpec
 from zarr.common import (
@@ -44,36 +51,45 @@ _bool = bool
 
 __all__ = ["ArrayMetadata"]
 
+# the v3 spec allows null entries in `dimension_names`
+_NONE_OR_STR = (type(None), str)
+
+# JSON has no representation for non-finite floats, so the v3 spec encodes non-finite float
+# fill values as strings
+_SPECIAL_FLOAT_STRINGS: dict[str, float] = {
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+
 
 class DataType(Enum):
-    bool = "bool"
-    int8 = "int8"
-    int16 = "int16"
-    int32 = "int32"
-    int64 = "int64"
-    uint8 = "uint8"
-    uint16 = "uint16"
-    uint32 = "uint32"
-    uint64 = "uint64"
-    float32 = "float32"
-    float64 = "float64"
+    # (value, byte count, numpy shortname)
+    bool = ("bool", 1, "bool")
+    int8 = ("int8", 1, "i1")
+    int16 = ("int16", 2, "i2")
+    int32 = ("int32", 4, "i4")
+    int64 = ("int64", 8, "i8")
+    uint8 = ("uint8", 1, "u1")
+    uint16 = ("uint16", 2, "u2")
+    uint32 = ("uint32", 4, "u4")
+    uint64 = ("uint64", 8, "u8")
+    float32 = ("float32", 4, "f4")
+    float64 = ("float64", 8, "f8")
+
+    _byte_count: int
+    _numpy_shortname: str
+
+    def __new__(cls, value: str, byte_count: int, numpy_shortname: str) -> DataType:
+        obj = object.__new__(cls)
+        obj._value_ = value
+        obj._byte_count = byte_count
+        obj._numpy_shortname = numpy_shortname
+        return obj
 
     @property
     def byte_count(self) -> int:
-        data_type_byte_counts = {
-            DataType.bool: 1,
-            DataType.int8: 1,
-            DataType.int16: 2,
-            DataType.int32: 4,
-            DataType.int64: 8,
-            DataType.uint8: 1,
-            DataType.uint16: 2,
-            DataType.uint32: 4,
-            DataType.uint64: 8,
-            DataType.float32: 4,
-            DataType.float64: 8,
-        }
-        return data_type_byte_counts[self]
+        return self._byte_count
 
     @property
     def has_endianness(self) -> _bool:
@@ -81,41 +97,135 @@ class DataType(Enum):
         return self.byte_count != 1
 
     def to_numpy_shortname(self) -> str:
-        data_type_to_numpy = {
-            DataType.bool: "bool",
-            DataType.int8: "i1",
-            DataType.int16: "i2",
-            DataType.int32: "i4",
-            DataType.int64: "i8",
-            DataType.uint8: "u1",
-            DataType.uint16: "u2",
-            DataType.uint32: "u4",
-            DataType.uint64: "u8",
-            DataType.float32: "f4",
-            DataType.float64: "f8",
-        }
-        return data_type_to_numpy[self]
+        return self._numpy_shortname
 
     @classmethod
     def from_dtype(cls, dtype: np.dtype[Any]) -> DataType:
-        dtype_to_data_type = {
-            "|b1": "bool",
-            "bool": "bool",
-            "|i1": "int8",
-            "<i2": "int16",
-            "<i4": "int32",
-            "<i8": "int64",
-            "|u1": "uint8",
-            "<u2": "uint16",
-            "<u4": "uint32",
-            "<u8": "uint64",
-            "<f4": "float32",
-            "<f8": "float64",
-        }
-        return DataType[dtype_to_data_type[dtype.str]]
+        return _DTYPE_TO_DATATYPE[dtype]
+
+
+_DTYPE_TO_DATATYPE: dict[np.dtype[Any], DataType] = {
+    np.dtype(dtype_str): data_type
+    for dtype_str, data_type in {
+        "|b1": DataType.bool,
+        "|i1": DataType.int8,
+        "<i2": DataType.int16,
+        "<i4": DataType.int32,
+        "<i8": DataType.int64,
+        "|u1": DataType.uint8,
+        "<u2": DataType.uint16,
+        "<u4": DataType.uint32,
+        "<u8": DataType.uint64,
+        "<f4": DataType.float32,
+        "<f8": DataType.float64,
+    }.items()
+}
+
+
+class V3JsonEncoder(json.JSONEncoder):
+    """
+    JSON encoder for Zarr V3 metadata documents, handling dtypes, numpy scalars, enums and
+    numcodecs codecs.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("indent", config.cached_get("json_indent"))
+        super().__init__(*args, **kwargs)
+
+    def default(self, o: Any) -> Any:
+        return _json_default(o)
+
+
+def _json_default(o: Any) -> Any:
+    handler = _DEFAULT_DISPATCH.get(type(o))
+    if handler is None:
+        handler = _resolve_default_handler(o)
+        if handler is None:
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        _DEFAULT_DISPATCH[type(o)] = handler
+    return handler(o)
+
+
+def _resolve_default_handler(o: Any) -> Callable[[Any], Any] | None:
+    if isinstance(o, np.dtype):
+        return str
+    if isinstance(o, np.generic):
+        return _numpy_scalar_to_json
+    if isinstance(o, Enum):
+        return _enum_to_json
+    # this serializes numcodecs compressors
+    # todo: implement to_dict for codecs
+    # imported lazily so that this module does not load numcodecs on import; this only runs
+    # once per type, see `_json_default`
+    import numcodecs.abc
+
+    if isinstance(o, numcodecs.abc.Codec):
+        return _numcodecs_to_json
+    return None
+
+
+def _numpy_scalar_to_json(o: np.generic) -> Any:
+    return o.item()
+
+
+def _enum_to_json(o: Enum) -> str:
+    return o.name
+
+
+def _numcodecs_to_json(o: numcodecs.abc.Codec) -> dict[str, Any]:
+    config: dict[str, Any] = o.get_config()
+    return config
+
+
+# handlers for `V3JsonEncoder.default`, keyed by concrete type and filled in on first use
+_DEFAULT_DISPATCH: dict[type, Callable[[Any], Any]] = {}
+
+
+def _orjson_can_encode(obj: Any) -> bool:
+    """
+    Whether orjson writes `obj` the same way as `V3JsonEncoder`. orjson writes non-finite
+    floats as null and enums by value rather than by name. The document is walked
+    iteratively and not copied.
+    """
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, dict):
+            stack.extend(o.values())
+        elif isinstance(o, list | tuple):
+            stack.extend(o)
+        elif isinstance(o, float | np.floating):
+            if not math.isfinite(o):
+                return False
+        elif isinstance(o, Enum) and o.value != o.name:
+            return False
+    return True
+
+
+def _encode_fill_value(fill_value: Any) -> Any:
+    # the v3 spec stores non-finite float fill values as strings
+    if isinstance(fill_value, float | np.floating) and not math.isfinite(fill_value):
+        if math.isnan(fill_value):
+            return "NaN"
+        return "Infinity" if fill_value > 0 else "-Infinity"
+    return fill_value
+
+
+def _v3_json_dumps(data: dict[str, Any]) -> bytes:
+    json_indent = config.cached_get("json_indent")
+    # orjson can only indent by 2 spaces
+    if _HAS_ORJSON and json_indent in (None, 2) and _orjson_can_encode(data):
+        try:
+            return orjson.dumps(
+                data, default=_json_default, option=orjson.OPT_INDENT_2 if json_indent else 0
+            )
+        except TypeError:
+            # e.g. non-str keys, which the stdlib encoder coerces to str
+            pass
+    return json.dumps(data, cls=V3JsonEncoder, indent=json_indent).encode()
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ArrayMetadata(Metadata, ABC):
     shape: ChunkCoords
     fill_value: Any
@@ -156,7 +266,7 @@ class ArrayMetadata(Metadata, ABC):
         pass
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ArrayV3Metadata(ArrayMetadata):
     shape: ChunkCoords
     data_type: np.dtype[Any]
@@ -165,7 +275,7 @@ class ArrayV3Metadata(ArrayMetadata):
     fill_value: Any
     codecs: tuple[Codec, ...]
     attributes: dict[str, Any] = field(default_factory=dict)
-    dimension_names: tuple[str, ...] | None = None
+    dimension_names: tuple[str | None, ...] | None = None
     zarr_format: Literal[3] = field(default=3, init=False)
     node_type: Literal["array"] = field(default="array", init=False)
 
@@ -179,7 +289,7 @@ class ArrayV3Metadata(ArrayMetadata):
         fill_value: Any,
         codecs: Iterable[Codec | dict[str, JSON]],
         attributes: None | dict[str, JSON],
-        dimension_names: None | Iterable[str],
+        dimension_names: None | Iterable[str | None],
     ) -> None:
         """
         Because the class is a frozen dataclass, we set attributes using object.__setattr__
@@ -200,7 +310,7 @@ class ArrayV3Metadata(ArrayMetadata):
             order="C",  # TODO: order is not needed here.
             prototype=default_buffer_prototype,  # TODO: prototype is not needed here.
         )
-        codecs_parsed = [c.evolve_from_array_spec(array_spec) for c in codecs_parsed_partial]
+        codecs_parsed = tuple(c.evolve_from_array_spec(array_spec) for c in codecs_parsed_partial)
 
         object.__setattr__(self, "shape", shape_parsed)
         object.__setattr__(self, "data_type", data_type_parsed)
@@ -210,6 +320,9 @@ class ArrayV3Metadata(ArrayMetadata):
         object.__setattr__(self, "dimension_names", dimension_names_parsed)
         object.__setattr__(self, "fill_value", fill_value_parsed)
         object.__setattr__(self, "attributes", attributes_parsed)
+        # slotted instances do not fall back to the class-level defaults of init=False fields
+        object.__setattr__(self, "zarr_format", 3)
+        object.__setattr__(self, "node_type", "array")
 
         self._validate_metadata()
 
@@ -255,24 +368,9 @@ class ArrayV3Metadata(ArrayMetadata):
         return self.chunk_key_encoding.encode_chunk_key(chunk_coords)
 
     def to_buffer_dict(self) -> dict[str, Buffer]:
-        def _json_convert(o: np.dtype[Any] | Enum | Codec) -> str | dict[str, Any]:
-            if isinstance(o, np.dtype):
-                return str(o)
-            if isinstance(o, Enum):
-                return o.name
-            # this serializes numcodecs compressors
-            # todo: implement to_dict for codecs
-            elif isinstance(o, numcodecs.abc.Codec):
-                config: dict[str, Any] = o.get_config()
-                return config
-            raise TypeError
-
-        json_indent = config.get("json_indent")
-        return {
-            ZARR_JSON: Buffer.from_bytes(
-                json.dumps(self.to_dict(), default=_json_convert, indent=json_indent).encode()
-            )
-        }
+        d = self.to_dict()
+        d["fill_value"] = _encode_fill_value(d["fill_value"])
+        return {ZARR_JSON: Buffer.from_bytes(_v3_json_dumps(d))}
 
     @classmethod
     def from_dict(cls, data: dict[str, JSON]) -> ArrayV3Metadata:
@@ -283,11 +381,16 @@ class ArrayV3Metadata(ArrayMetadata):
         _ = parse_node_type_array(data.pop("node_type"))  # type: ignore[arg-type]
 
         data["dimension_names"] = data.pop("dimension_names", None)
+        # non-finite float fill values are stored as strings, see `_encode_fill_value`
+        fill_value = data.get("fill_value")
+        if isinstance(fill_value, str) and fill_value in _SPECIAL_FLOAT_STRINGS:
+            data["fill_value"] = _SPECIAL_FLOAT_STRINGS[fill_value]
 
         return cls(**data)  # type: ignore[arg-type]
 
     def to_dict(self) -> dict[str, Any]:
-        out_dict = super().to_dict()
+        # `dataclass(slots=True)` recreates the class, which breaks zero-argument `super()`
+        out_dict = Metadata.to_dict(self)
 
         if not isinstance(out_dict, dict):
             raise TypeError(f"Expected dict. Got {type(out_dict)}.")
@@ -384,7 +487,7 @@ class ArrayV2Metadata(ArrayMetadata):
         assert isinstance(zarray_dict, dict)
         zattrs_dict = zarray_dict.pop("attributes", {})
         assert isinstance(zattrs_dict, dict)
-        json_indent = config.get("json_indent")
+        json_indent = config.cached_get("json_indent")
         return {
             ZARRAY_JSON: Buffer.from_bytes(
                 json.dumps(zarray_dict, default=_json_convert, indent=json_indent).encode()
@@ -433,14 +536,15 @@ class ArrayV2Metadata(ArrayMetadata):
         return replace(self, attributes=attributes)
 
 
-def parse_dimension_names(data: None | Iterable[str]) -> tuple[str, ...] | None:
+def parse_dimension_names(data: None | Iterable[str | None]) -> tuple[str | None, ...] | None:
     if data is None:
         return data
-    elif all(isinstance(x, str) for x in data):
-        return tuple(data)
-    else:
-        msg = f"Expected either None or a iterable of str, got {type(data)}"
-        raise TypeError(msg)
+    if isinstance(data, Iterable):
+        data_tuple = tuple(data)
+        if all(isinstance(x, _NONE_OR_STR) for x in data_tuple):
+            return data_tuple
+    msg = f"Expected either None or a iterable of str or None, got {type(data)}"
+    raise TypeError(msg)
 
 
 # todo: real validation
@@ -502,7 +606,7 @@ def create_pipeline(data: Iterable[Codec | JSON]) -> CodecPipeline:
 
 
 def parse_codecs(data: Iterable[Codec | dict[str, JSON]]) -> tuple[Codec, ...]:
-    out: tuple[Codec, ...] = ()
+    out: list[Codec] = []
 
     if not isinstance(data, Iterable):
         raise TypeError(f"Expected iterable, got {type(data)}")
@@ -511,9 +615,9 @@ def parse_codecs(data: Iterable[Codec | dict[str, JSON]]) -> tuple[Codec, ...]:
         if isinstance(
             c, ArrayArrayCodec | ArrayBytesCodec | BytesBytesCodec
         ):  # Can't use Codec here because of mypy limitation
-            out += (c,)
+            out.append(c)
         else:
             name_parsed, _ = parse_named_configuration(c, require_configuration=False)
-            out += (get_codec_class(name_parsed).from_dict(c),)
+            out.append(get_codec_class(name_parsed).from_dict(c))
 
-    return out
+    return tuple(out)
@@ -1,11 +1,38 @@
 from typing import Any
 import warnings
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
+from contextlib import contextmanager
+from types import MappingProxyType
+
+from numcodecs.compat import ensure_bytes
 
 from zarr.v2._storage.store import Store
 from zarr.v2.util import json_dumps
 
 
+_MISSING = object()
+# bound once so that key checks map a C function over the keys
+_is_str = str.__instancecheck__
+
+
+def _freeze(obj):
+    # read-only copy of a JSON-like value
+    if isinstance(obj, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(map(_freeze, obj))
+    return obj
+
+
+def _thaw(obj):
+    # inverse of _freeze, producing values the JSON encoder accepts
+    if isinstance(obj, Mapping):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return list(map(_thaw, obj))
+    return obj
+
+
 class Attributes(MutableMapping[str, Any]):
     """Class providing access to user attributes on an array or group. Should not be
     instantiated directly, will be available via the `.attrs` property of an array or
@@ -23,46 +50,101 @@ class Attributes(MutableMapping[str, Any]):
         If True (default), attributes will be cached locally.
     synchronizer : Synchronizer
         Only necessary if attributes may be modified from multiple threads or processes.
+    frozen : bool, optional
+        If True, nested values are returned as read-only mappings and tuples, so that
+        values read from the cache cannot be modified in place.
 
     """
 
-    def __init__(self, store, key=".zattrs", read_only=False, cache=True, synchronizer=None):
+    __slots__ = (
+        "store",
+        "key",
+        "read_only",
+        "cache",
+        "synchronizer",
+        "frozen",
+        "_cached_asdict",
+        "_cached_bytes",
+        "_bulk_depth",
+        "_bulk_pending",
+        "_sorted_keys",
+    )
+
+    def __init__(
+        self, store, key=".zattrs", read_only=False, cache=True, synchronizer=None, frozen=False
+    ):
         _Store = Store
         self.store = _Store._ensure_store(store)
         self.key = key
         self.read_only = read_only
         self.cache = cache
         self._cached_asdict = None
+        self._cached_bytes = None
+        self._bulk_depth = 0
+        self._bulk_pending = None
+        self._sorted_keys = None
         self.synchronizer = synchronizer
+        self.frozen = frozen
 
-    def _get_nosync(self):
+    def _load_nosync(self):
+        # returns the stored attributes and the bytes they were parsed from, if any
+        if self._bulk_pending is not None:
+            # writes deferred by bulk() have not reached the store yet
+            return dict(self._bulk_pending), None
         try:
             data = self.store[self.key]
         except KeyError:
-            d: dict[str, Any] = dict()
-        else:
-            d = self.store._metadata_class.parse_metadata(data)
-        return d
+            return dict(), None
+        # consolidated metadata stores return already parsed mappings
+        raw = None if isinstance(data, Mapping) else ensure_bytes(data)
+        if (
+            self.cache
+            and self._cached_asdict is not None
+            and raw is not None
+            and raw == self._cached_bytes
+        ):
+            # unchanged since this instance last read or wrote it, so skip parsing; copy so
+            # that the cache is left untouched if the caller modifies the result
+            return self._cached_asdict.copy(), raw
+        d = self.store._metadata_class.parse_metadata(data)
+        if self.frozen:
+            # freeze once here, rather than copying on every read
+            d = {k: _freeze(v) for k, v in d.items()}
+        return d, raw
+
+    def _get_nosync(self):
+        return self._load_nosync()[0]
 
     def asdict(self):
-        """Retrieve all attributes as a dictionary."""
+        """Retrieve all attributes as a read-only mapping. Use ``dict(attrs.asdict())``
+        to obtain a copy that can be modified."""
+        return MappingProxyType(self._asdict_nosync())
+
+    def _asdict_nosync(self):
         if self.cache and self._cached_asdict is not None:
             return self._cached_asdict
-        d = self._get_nosync()
+        d, raw = self._load_nosync()
         if self.cache:
-            self._cached_asdict = d
+            self._cached_asdict, self._cached_bytes = d, raw
         return d
 
+    def _fast_asdict(self):
+        # cache hit without going through asdict(), for the mapping accessors
+        d = self._cached_asdict
+        if d is not None and self.cache:
+            return d
+        return self._asdict_nosync()
+
     def refresh(self):
         """Refresh cached attributes from the store."""
         if self.cache:
-            self._cached_asdict = self._get_nosync()
+            self._cached_asdict, self._cached_bytes = self._load_nosync()
 
     def __contains__(self, x):
-        return x in self.asdict()
+        return x in self._fast_asdict()
 
     def __getitem__(self, item):
-        return self.asdict()[item]
+        return self._fast_asdict()[item]
 
     def _write_op(self, f, *args, **kwargs):
         # guard condition
@@ -84,11 +166,14 @@ class Attributes(MutableMapping[str, Any]):
         d = self._get_nosync()
 
         # set key value
-
         d[item] = value
 
-        # _put modified data
-        self._put_nosync(d)
+        # _put modified data; the existing keys are known to be strings, whether
+        # loaded from the store or cached after an earlier check
+        if isinstance(item, str):
+            self._store_nosync(d)
+        else:
+            self._put_nosync(d)
 
     def __delitem__(self, item):
         self._write_op(self._delitem_nosync, item)
@@ -100,17 +185,58 @@ class Attributes(MutableMapping[str, Any]):
         # delete key value
         del d[key]
 
-        # _put modified data
-        self._put_nosync(d)
+        # _put modified data; removing a key cannot introduce a non-string one
+        self._store_nosync(d)
+
+    def setdefault(self, key, default=None):
+        """Return the value of attribute `key`, setting it to `default` first if it is
+        not present."""
+        try:
+            return self._fast_asdict()[key]
+        except KeyError:
+            return self._write_op(self._setdefault_nosync, key, default)
+
+    def _setdefault_nosync(self, key, default):
+        # another writer may have set the key in the meantime
+        d = self._get_nosync()
+        if key in d:
+            return d[key]
+        d[key] = default
+        if isinstance(key, str):
+            self._store_nosync(d)
+        else:
+            self._put_nosync(d)
+        return _freeze(default) if self.frozen else default
+
+    def pop(self, key, default=_MISSING):
+        """Remove attribute `key` and return its value, or `default` if it is not
+        present."""
+        if key not in self._fast_asdict():
+            # nothing to remove, so no write access is needed
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._write_op(self._pop_nosync, key, default)
+
+    def _pop_nosync(self, key, default):
+        d = self._get_nosync()
+        if key not in d:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = d.pop(key)
+        self._store_nosync(d)
+        return value
 
     def put(self, d):
         """Overwrite all attributes with the key/value pairs in the provided dictionary
         `d` in a single operation."""
-        self._write_op(self._put_nosync, d)
+        # copy, so that later changes to `d` do not leak into the cached attributes
+        self._write_op(self._put_nosync, dict(d))
 
     def _put_nosync(self, d):
         d_to_check = d
-        if not all(isinstance(item, str) for item in d_to_check):
+        if not all(map(_is_str, d_to_check)):
             # TODO: Raise an error for non-string keys
             # raise TypeError("attribute keys must be strings")
             warnings.warn(
@@ -126,9 +252,81 @@ class Attributes(MutableMapping[str, Any]):
 
             d = d_to_check
 
-        self.store[self.key] = json_dumps(d)
+        self._store_nosync(d)
+
+    def _store_nosync(self, d):
+        # `d` must only have string keys here
+        if self.frozen:
+            # new values may not be frozen yet
+            d = {k: _freeze(v) for k, v in d.items()}
+        else:
+            # values copied from the attributes of a frozen array or group are thawed
+            d = _thaw(d)
+
+        if self._bulk_depth:
+            # defer the store write until the outermost bulk() block exits
+            self._bulk_pending = d
+            if self.cache:
+                self._cached_asdict = d
+            return
+
+        b = json_dumps(_thaw(d) if self.frozen else d)
         if self.cache:
+            # skip the store write if the serialized attributes did not change; another
+            # writer may have changed the store since our last write, so check it first
+            if b != self._cached_bytes or not self._store_holds(b):
+                self.store[self.key] = b
+                self._cached_bytes = b
+            # the cached dict is replaced rather than modified in place, so readers
+            # always see a consistent snapshot without taking the write lock
             self._cached_asdict = d
+        else:
+            self.store[self.key] = b
+
+    def _store_holds(self, b):
+        try:
+            return ensure_bytes(self.store[self.key]) == b
+        except KeyError:
+            return False
+
+    @contextmanager
+    def bulk(self):
+        """Context manager deferring writes to the store until the block exits, so
+        that several modifications are stored in a single operation.
+
+        The deferred modifications are held by this instance, so a bulk block must
+        only be used from a single thread, and not at all when a synchronizer is
+        set.
+
+        Examples
+        --------
+        >>> import zarr.v2 as zarr
+        >>> g = zarr.group()
+        >>> with g.attrs.bulk():
+        ...     g.attrs["foo"] = 1
+        ...     g.attrs["bar"] = 2
+        >>> sorted(g.attrs)
+        ['bar', 'foo']
+
+        """
+        if self.synchronizer is not None:
+            raise ValueError("bulk() cannot be used with a synchronizer")
+        self._bulk_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._bulk_depth == 1:
+                # discard the deferred modifications
+                self._bulk_pending = None
+                self._cached_asdict = None
+            raise
+        finally:
+            self._bulk_depth -= 1
+        if self._bulk_depth == 0 and self._bulk_pending is not None:
+            d, self._bulk_pending = self._bulk_pending, None
+            # repopulated by _put_nosync once the store write succeeds
+            self._cached_asdict = None
+            self._write_op(self._put_nosync, d)
 
     # noinspection PyMethodOverriding
     def update(self, *args, **kwargs):
@@ -145,14 +343,23 @@ class Attributes(MutableMapping[str, Any]):
         # _put modified data
         self._put_nosync(d)
 
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
     def keys(self):
-        return self.asdict().keys()
+        return self._fast_asdict().keys()
 
     def __iter__(self):
-        return iter(self.asdict())
+        return iter(self._fast_asdict())
 
     def __len__(self):
-        return len(self.asdict())
+        return len(self._fast_asdict())
 
     def _ipython_key_completions_(self):
-        return sorted(self)
+        # the cached dict is replaced on every modification, so its identity tells
+        # whether the keys sorted last time are still current
+        d = self._fast_asdict()
+        if self._sorted_keys is None or self._sorted_keys[0] is not d:
+            self._sorted_keys = (d, sorted(d))
+        return list(self._sorted_keys[1])
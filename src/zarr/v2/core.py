@@ -87,6 +87,9 @@ class Array:
         If True (default), user attributes will be cached for attribute read
         operations. If False, user attributes are reloaded from the store prior
         to all attribute read operations.
+    freeze_attrs : bool, optional
+        If True, nested user attribute values are returned as read-only mappings
+        and tuples, so that they cannot be modified in place. Defaults to False.
     partial_decompress : bool, optional
         If True and while the chunk_store is a FSStore and the compression used
         is Blosc, when getting data from the array chunks will be partially
@@ -124,6 +127,7 @@ class Array:
         partial_decompress=False,
         write_empty_chunks=True,
         meta_array=None,
+        freeze_attrs=False,
     ):
         # N.B., expect at this point store is fully initialized with all
         # configuration metadata fully specified and normalized
@@ -157,7 +161,12 @@ class Array:
         # initialize attributes
         akey = _prefix_to_attrs_key(self._store, self._key_prefix)
         self._attrs = Attributes(
-            store, key=akey, read_only=read_only, synchronizer=synchronizer, cache=cache_attrs
+            store,
+            key=akey,
+            read_only=read_only,
+            synchronizer=synchronizer,
+            cache=cache_attrs,
+            frozen=freeze_attrs,
         )
 
         # initialize info reporter
@@ -2461,6 +2470,7 @@ class Array:
             "synchronizer": self._synchronizer,
             "cache_metadata": self._cache_metadata,
             "cache_attrs": self._attrs.cache,
+            "freeze_attrs": self._attrs.frozen,
             "partial_decompress": self._partial_decompress,
             "write_empty_chunks": self._write_empty_chunks,
             "meta_array": self._meta_array,
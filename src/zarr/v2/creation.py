@@ -42,6 +42,7 @@ def create(
     write_empty_chunks=True,
     *,
     meta_array=None,
+    freeze_attrs=False,
     **kwargs,
 ):
     """Create an array.
@@ -86,6 +87,9 @@ def create(
         If True (default), user attributes will be cached for attribute read
         operations. If False, user attributes are reloaded from the store prior
         to all attribute read operations.
+    freeze_attrs : bool, optional
+        If True, nested user attribute values are returned as read-only mappings
+        and tuples, so that they cannot be modified in place. Defaults to False.
     read_only : bool, optional
         True if array should be protected against modification.
     object_codec : Codec, optional
@@ -200,6 +204,7 @@ def create(
         synchronizer=synchronizer,
         cache_metadata=cache_metadata,
         cache_attrs=cache_attrs,
+        freeze_attrs=freeze_attrs,
         read_only=read_only,
         write_empty_chunks=write_empty_chunks,
         meta_array=meta_array,
@@ -440,6 +445,7 @@ def open_array(
     *,
     dimension_separator=None,
     meta_array=None,
+    freeze_attrs=False,
     **kwargs,
 ):
     """Open an array using file-mode-like semantics.
@@ -481,6 +487,9 @@ def open_array(
         If True (default), user attributes will be cached for attribute read
         operations. If False, user attributes are reloaded from the store prior
         to all attribute read operations.
+    freeze_attrs : bool, optional
+        If True, nested user attribute values are returned as read-only mappings
+        and tuples, so that they cannot be modified in place. Defaults to False.
     path : string, optional
         Array path within store.
     object_codec : Codec, optional
@@ -645,6 +654,7 @@ def open_array(
         synchronizer=synchronizer,
         cache_metadata=cache_metadata,
         cache_attrs=cache_attrs,
+        freeze_attrs=freeze_attrs,
         path=path,
         chunk_store=chunk_store,
         write_empty_chunks=write_empty_chunks,
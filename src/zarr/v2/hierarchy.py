@@ -69,6 +69,9 @@ class Group(MutableMapping[str, Any]):
         If True (default), user attributes will be cached for attribute read
         operations. If False, user attributes are reloaded from the store prior
         to all attribute read operations.
+    freeze_attrs : bool, optional
+        If True, nested user attribute values are returned as read-only mappings
+        and tuples, so that they cannot be modified in place. Defaults to False.
     synchronizer : object, optional
         Array synchronizer.
 
@@ -138,6 +141,7 @@ class Group(MutableMapping[str, Any]):
         synchronizer=None,
         *,
         meta_array=None,
+        freeze_attrs=False,
     ):
         store: BaseStore = _normalize_store_arg(store)
         if chunk_store is not None:
@@ -175,7 +179,12 @@ class Group(MutableMapping[str, Any]):
         akey = self._key_prefix + attrs_key
 
         self._attrs = Attributes(
-            store, key=akey, read_only=read_only, cache=cache_attrs, synchronizer=synchronizer
+            store,
+            key=akey,
+            read_only=read_only,
+            cache=cache_attrs,
+            synchronizer=synchronizer,
+            frozen=freeze_attrs,
         )
 
         # setup info
@@ -343,6 +352,7 @@ class Group(MutableMapping[str, Any]):
             "read_only": self._read_only,
             "chunk_store": self._chunk_store,
             "cache_attrs": self._attrs.cache,
+            "freeze_attrs": self._attrs.frozen,
             "synchronizer": self._synchronizer,
             "meta_array": self._meta_array,
         }
@@ -409,6 +419,7 @@ class Group(MutableMapping[str, Any]):
                 chunk_store=self._chunk_store,
                 synchronizer=self._synchronizer,
                 cache_attrs=self.attrs.cache,
+                freeze_attrs=self.attrs.frozen,
                 meta_array=self._meta_array,
             )
         elif contains_group(self._store, path, explicit_only=True):
@@ -418,6 +429,7 @@ class Group(MutableMapping[str, Any]):
                 path=path,
                 chunk_store=self._chunk_store,
                 cache_attrs=self.attrs.cache,
+                freeze_attrs=self.attrs.frozen,
                 synchronizer=self._synchronizer,
                 meta_array=self._meta_array,
             )
@@ -506,6 +518,7 @@ class Group(MutableMapping[str, Any]):
                         read_only=self._read_only,
                         chunk_store=self._chunk_store,
                         cache_attrs=self.attrs.cache,
+                        freeze_attrs=self.attrs.frozen,
                         synchronizer=self._synchronizer,
                     ),
                 )
@@ -847,6 +860,7 @@ class Group(MutableMapping[str, Any]):
             read_only=self._read_only,
             chunk_store=self._chunk_store,
             cache_attrs=self.attrs.cache,
+            freeze_attrs=self.attrs.frozen,
             synchronizer=self._synchronizer,
         )
 
@@ -896,6 +910,7 @@ class Group(MutableMapping[str, Any]):
             read_only=self._read_only,
             chunk_store=self._chunk_store,
             cache_attrs=self.attrs.cache,
+            freeze_attrs=self.attrs.frozen,
             synchronizer=self._synchronizer,
         )
 
@@ -973,6 +988,7 @@ class Group(MutableMapping[str, Any]):
         # determine synchronizer
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
 
         # create array
         if data is None:
@@ -1018,6 +1034,7 @@ class Group(MutableMapping[str, Any]):
             synchronizer = kwargs.get("synchronizer", self._synchronizer)
             cache_metadata = kwargs.get("cache_metadata", True)
             cache_attrs = kwargs.get("cache_attrs", self.attrs.cache)
+            freeze_attrs = kwargs.get("freeze_attrs", self.attrs.frozen)
             a = Array(
                 self._store,
                 path=path,
@@ -1026,6 +1043,7 @@ class Group(MutableMapping[str, Any]):
                 synchronizer=synchronizer,
                 cache_metadata=cache_metadata,
                 cache_attrs=cache_attrs,
+                freeze_attrs=freeze_attrs,
                 meta_array=self._meta_array,
             )
             shape = normalize_shape(shape)
@@ -1056,6 +1074,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return create(store=self._store, path=path, chunk_store=self._chunk_store, **kwargs)
 
     def empty(self, name, **kwargs):
@@ -1067,6 +1086,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return empty(store=self._store, path=path, chunk_store=self._chunk_store, **kwargs)
 
     def zeros(self, name, **kwargs):
@@ -1078,6 +1098,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return zeros(store=self._store, path=path, chunk_store=self._chunk_store, **kwargs)
 
     def ones(self, name, **kwargs):
@@ -1089,6 +1110,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return ones(store=self._store, path=path, chunk_store=self._chunk_store, **kwargs)
 
     def full(self, name, fill_value, **kwargs):
@@ -1100,6 +1122,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return full(
             store=self._store,
             path=path,
@@ -1117,6 +1140,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return array(data, store=self._store, path=path, chunk_store=self._chunk_store, **kwargs)
 
     def empty_like(self, name, data, **kwargs):
@@ -1128,6 +1152,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return empty_like(
             data, store=self._store, path=path, chunk_store=self._chunk_store, **kwargs
         )
@@ -1141,6 +1166,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return zeros_like(
             data, store=self._store, path=path, chunk_store=self._chunk_store, **kwargs
         )
@@ -1154,6 +1180,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return ones_like(
             data, store=self._store, path=path, chunk_store=self._chunk_store, **kwargs
         )
@@ -1167,6 +1194,7 @@ class Group(MutableMapping[str, Any]):
         path = self._item_path(name)
         kwargs.setdefault("synchronizer", self._synchronizer)
         kwargs.setdefault("cache_attrs", self.attrs.cache)
+        kwargs.setdefault("freeze_attrs", self.attrs.frozen)
         return full_like(
             data, store=self._store, path=path, chunk_store=self._chunk_store, **kwargs
         )
@@ -1223,6 +1251,7 @@ def group(
     path=None,
     *,
     meta_array=None,
+    freeze_attrs=False,
 ):
     """Create a group.
 
@@ -1240,6 +1269,9 @@ def group(
         If True (default), user attributes will be cached for attribute read
         operations. If False, user attributes are reloaded from the store prior
         to all attribute read operations.
+    freeze_attrs : bool, optional
+        If True, nested user attribute values are returned as read-only mappings
+        and tuples, so that they cannot be modified in place. Defaults to False.
     synchronizer : object, optional
         Array synchronizer.
     path : string, optional
@@ -1287,6 +1319,7 @@ def group(
         read_only=False,
         chunk_store=chunk_store,
         cache_attrs=cache_attrs,
+        freeze_attrs=freeze_attrs,
         synchronizer=synchronizer,
         path=path,
         meta_array=meta_array,
@@ -1303,6 +1336,7 @@ def open_group(
     storage_options=None,
     *,
     meta_array=None,
+    freeze_attrs=False,
 ):
     """Open a group using file-mode-like semantics.
 
@@ -1319,6 +1353,9 @@ def open_group(
         If True (default), user attributes will be cached for attribute read
         operations. If False, user attributes are reloaded from the store prior
         to all attribute read operations.
+    freeze_attrs : bool, optional
+        If True, nested user attribute values are returned as read-only mappings
+        and tuples, so that they cannot be modified in place. Defaults to False.
     synchronizer : object, optional
         Array synchronizer.
     path : string, optional
@@ -1394,6 +1431,7 @@ def open_group(
         store,
         read_only=read_only,
         cache_attrs=cache_attrs,
+        freeze_attrs=freeze_attrs,
         synchronizer=synchronizer,
         path=path,
         chunk_store=chunk_store,
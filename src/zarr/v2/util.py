@@ -1,7 +1,9 @@
 import inspect
+import io
 import json
 import math
 import numbers
+from itertools import islice
 from textwrap import TextWrapper
 import mmap
 import time
@@ -33,6 +35,11 @@ from numcodecs.ndarray_like import NDArrayLike
 from numcodecs.registry import codec_registry
 from numcodecs.blosc import cbuffer_sizes, cbuffer_metainfo
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 KeyType = TypeVar("KeyType")
 ValueType = TypeVar("ValueType")
 
@@ -64,15 +71,72 @@ class NumberEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 
+_json_encoder = NumberEncoder(indent=4, sort_keys=True, ensure_ascii=True, separators=(",", ": "))
+
+
+def _json_floatstr(o: float) -> str:
+    # same spelling as the stdlib encoder
+    if o != o:
+        return "NaN"
+    if o == math.inf:
+        return "Infinity"
+    if o == -math.inf:
+        return "-Infinity"
+    return float.__repr__(o)
+
+
+_json_scalar_encoders: Dict[type, Callable[[Any], str]] = {
+    str: json.encoder.encode_basestring_ascii,
+    int: int.__repr__,
+    float: _json_floatstr,
+    bool: lambda o: "true" if o else "false",
+    type(None): lambda o: "null",
+}
+
+
+def _json_dumps_flat(o: Any) -> Optional[bytes]:
+    # Fast path for non-empty dicts mapping str to scalars, the typical shape of user
+    # attributes, producing the same output as `_json_encoder`. Returns None for
+    # anything else.
+    if type(o) is not dict or not o:
+        return None
+    items = []
+    for k, v in o.items():
+        encode = _json_scalar_encoders.get(type(v))
+        if encode is None or type(k) is not str:
+            return None
+        items.append((k, encode(v)))
+    # keys are unique, so only they are compared
+    items.sort()
+    encode_key = json.encoder.encode_basestring_ascii
+    lines = ",\n".join([f"    {encode_key(k)}: {v}" for k, v in items])
+    return f"{{\n{lines}\n}}".encode("ascii")
+
+
 def json_dumps(o: Any) -> bytes:
     """Write JSON in a consistent, human-readable way."""
-    return json.dumps(
-        o, indent=4, sort_keys=True, ensure_ascii=True, separators=(",", ": "), cls=NumberEncoder
-    ).encode("ascii")
+    b = _json_dumps_flat(o)
+    if b is not None:
+        return b
+    # encode batches of chunks into a buffer instead of joining the whole document
+    # into one str first, so that large documents are not held twice in memory
+    chunks = _json_encoder.iterencode(o)
+    buf = io.BytesIO()
+    while True:
+        batch = "".join(islice(chunks, 4096))
+        if not batch:
+            return buf.getvalue()
+        buf.write(batch.encode("ascii"))
 
 
 def json_loads(s: Union[bytes, str]) -> Dict[str, Any]:
     """Read JSON in a consistent way."""
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity or integers beyond 64 bits, which only the stdlib parser accepts
+            pass
     return json.loads(ensure_text(s, "utf-8"))
 
 
@@ -1,11 +1,15 @@
 import json
+import pickle
+from types import MappingProxyType
 
 import pytest
 
 from zarr.v2.attrs import Attributes
 from zarr.v2.storage import KVStore, DirectoryStore
 from .util import CountingDict
+from zarr.v2.creation import open_array, zeros
 from zarr.v2.hierarchy import group
+from zarr.v2.sync import ThreadSynchronizer
 
 
 def _init_store():
@@ -34,6 +38,12 @@ class TestAttributes:
         d = json.loads(str(store[attrs_key], "utf-8"))
         assert dict(foo="bar", baz=42) == d
 
+    def test_slots(self):
+        a = self.init_attributes(_init_store())
+        assert not hasattr(a, "__dict__")
+        with pytest.raises(AttributeError):
+            a.foo = "bar"
+
     def test_utf8_encoding(self, project_root):
         fixdir = project_root / "fixture"
         testdir = fixdir / "utf8attrs"
@@ -82,6 +92,50 @@ class TestAttributes:
         assert a["bar"] == 84
         assert "baz" not in a
 
+    def test_setdefault_pop_ior(self):
+        store = CountingDict()
+        attrs_key = ".zattrs"
+        a = self.init_attributes(store)
+        assert a.setdefault("foo", "bar") == "bar"
+        assert a.setdefault("foo", "baz") == "bar"
+        assert 1 == store.counter["__setitem__", attrs_key]
+
+        a |= dict(baz=42, spam="eggs")
+        assert isinstance(a, Attributes)
+        assert 2 == store.counter["__setitem__", attrs_key]
+
+        assert a.pop("baz") == 42
+        assert a.pop("baz", None) is None
+        with pytest.raises(KeyError):
+            a.pop("baz")
+        assert 3 == store.counter["__setitem__", attrs_key]
+        assert json.loads(str(store[attrs_key], "utf-8")) == dict(foo="bar", spam="eggs")
+
+    def test_asdict_read_only(self):
+        store = _init_store()
+        a = self.init_attributes(store)
+        a["foo"] = "bar"
+        d = a.asdict()
+        assert d == dict(foo="bar")
+        with pytest.raises(TypeError):
+            d["foo"] = "baz"
+        copy = dict(d)
+        copy["foo"] = "baz"
+        assert a["foo"] == "bar"
+
+    def test_put_copies(self):
+        store = _init_store()
+        a = self.init_attributes(store)
+        d = dict(foo="bar")
+        a.put(d)
+        before = a.asdict()
+        d["baz"] = 42
+        assert a.asdict() == dict(foo="bar")
+
+        # modifications replace the cached dict instead of mutating it
+        a["spam"] = "eggs"
+        assert before == dict(foo="bar")
+
     def test_iterators(self):
         store = _init_store()
         a = self.init_attributes(store)
@@ -112,6 +166,14 @@ class TestAttributes:
             del a["foo"]
         with pytest.raises(PermissionError):
             a.update(foo="quux")
+        with pytest.raises(PermissionError):
+            a.pop("foo")
+        assert a.pop("quux", None) is None
+        with pytest.raises(KeyError):
+            a.pop("quux")
+        with pytest.raises(PermissionError):
+            a.setdefault("quux", 1)
+        assert a.setdefault("foo", "quux") == "bar"
 
     def test_key_completions(self):
         store = _init_store()
@@ -129,6 +191,10 @@ class TestAttributes:
         assert "123" in d
         assert "asdf;" in d
         assert "baz" not in d
+        assert d == sorted(d)
+        assert a._ipython_key_completions_() is not d
+        del a["foo"]
+        assert a._ipython_key_completions_() == ["123", "asdf;"]
 
     def test_caching_on(self):
         # caching is turned on by default
@@ -266,3 +332,169 @@ class TestAttributes:
 
         with pytest.warns(DeprecationWarning, match=warning_msg):
             a.update({1: "foo"})
+
+    def test_caching_synchronizer(self):
+        # modifications start from the stored attributes, not from the cache
+        store = CountingDict()
+        attrs_key = ".zattrs"
+        store[attrs_key] = json.dumps(dict(foo="xxx")).encode("ascii")
+        a = Attributes(store, key=attrs_key, synchronizer=ThreadSynchronizer())
+        assert a["foo"] == "xxx"
+        assert 1 == store.counter["__getitem__", attrs_key]
+        store[attrs_key] = json.dumps(dict(foo="xxx", bar=42)).encode("ascii")
+        a["baz"] = 4.2
+        assert 2 == store.counter["__getitem__", attrs_key]
+        assert a.asdict() == dict(foo="xxx", bar=42, baz=4.2)
+
+    def test_interleaved_writers(self):
+        # attributes written through another handle are kept, without a synchronizer too
+        store = CountingDict()
+        attrs_key = ".zattrs"
+        a = self.init_attributes(store)
+        b = self.init_attributes(store)
+        a["x"] = 1
+        b["y"] = 2
+        a["w"] = 3
+        b.update(v=4)
+        del a["x"]
+        expected = dict(y=2, w=3, v=4)
+        assert json.loads(str(store[attrs_key], "utf-8")) == expected
+        assert a.asdict() == expected
+
+        # the stored attributes are only parsed again if they changed
+        get_cnt = store.counter["__getitem__", attrs_key]
+        a["u"] = 5
+        assert get_cnt + 1 == store.counter["__getitem__", attrs_key]
+
+    def test_unchanged_write_after_other_writer(self):
+        # a write equal to the last one of this instance must not be skipped if another
+        # writer has changed the store in between
+        store = _init_store()
+        a = Attributes(store, synchronizer=ThreadSynchronizer())
+        b = Attributes(store, synchronizer=ThreadSynchronizer())
+        a["foo"] = 1
+        b["foo"] = 2
+        a["foo"] = 1
+        assert json.loads(str(store[".zattrs"], "utf-8")) == dict(foo=1)
+        assert a.asdict() == dict(foo=1)
+
+        a = self.init_attributes(store)
+        b = self.init_attributes(store)
+        a.put(dict(foo=1))
+        b.put(dict(foo=2))
+        a.put(dict(foo=1))
+        assert json.loads(str(store[".zattrs"], "utf-8")) == dict(foo=1)
+
+    def test_skip_unchanged_write(self):
+        store = CountingDict()
+        attrs_key = ".zattrs"
+        a = self.init_attributes(store)
+        a["foo"] = "bar"
+        assert 1 == store.counter["__setitem__", attrs_key]
+        a["foo"] = "bar"
+        a.update(foo="bar")
+        a.put(dict(foo="bar"))
+        assert 1 == store.counter["__setitem__", attrs_key]
+        a["foo"] = "baz"
+        assert 2 == store.counter["__setitem__", attrs_key]
+
+        # the store is checked before a write is skipped
+        store[attrs_key] = json.dumps(dict(foo="qux")).encode("ascii")
+        a.put(dict(foo="baz"))
+        assert 4 == store.counter["__setitem__", attrs_key]
+
+    def test_bulk(self):
+        store = CountingDict()
+        attrs_key = ".zattrs"
+        a = self.init_attributes(store)
+        with a.bulk():
+            a["foo"] = "bar"
+            a["baz"] = 42
+            with a.bulk():
+                a.update(spam="eggs")
+            del a["baz"]
+            assert 0 == store.counter["__setitem__", attrs_key]
+            assert a.asdict() == dict(foo="bar", spam="eggs")
+        assert 1 == store.counter["__setitem__", attrs_key]
+        assert json.loads(str(store[attrs_key], "utf-8")) == dict(foo="bar", spam="eggs")
+
+        # modifications are discarded if the block raises
+        with pytest.raises(ValueError):
+            with a.bulk():
+                a["foo"] = "quux"
+                raise ValueError
+        assert 1 == store.counter["__setitem__", attrs_key]
+        assert a["foo"] == "bar"
+
+
+class TestAttributesFrozen(TestAttributes):
+    def init_attributes(self, store, read_only=False, cache=True):
+        root = ".z"
+        return Attributes(store, key=root + "attrs", read_only=read_only, cache=cache, frozen=True)
+
+    def test_frozen(self):
+        store = _init_store()
+        a = self.init_attributes(store)
+        a["foo"] = {"bar": [1, {"baz": 2}]}
+        assert a["foo"] == MappingProxyType({"bar": (1, MappingProxyType({"baz": 2}))})
+        with pytest.raises(TypeError):
+            a["foo"]["bar"] = 42
+        assert json.loads(str(store[".zattrs"], "utf-8")) == {"foo": {"bar": [1, {"baz": 2}]}}
+
+        # setdefault() returns the stored value
+        assert a.setdefault("qux", [1]) == (1,)
+        assert a.setdefault("qux", [2]) == (1,)
+        del a["qux"]
+
+        # values loaded from the store are frozen too
+        a.refresh()
+        assert isinstance(a["foo"]["bar"], tuple)
+        a["spam"] = "eggs"
+        assert json.loads(str(store[".zattrs"], "utf-8")) == {
+            "foo": {"bar": [1, {"baz": 2}]},
+            "spam": "eggs",
+        }
+
+
+def test_freeze_attrs():
+    g = group(freeze_attrs=True)
+    g.attrs["foo"] = {"bar": [1, 2]}
+    assert g.attrs["foo"] == MappingProxyType({"bar": (1, 2)})
+    with pytest.raises(TypeError):
+        g.attrs["foo"]["bar"] = 42
+
+    # arrays and groups created through or retrieved from the group inherit the mode
+    z = g.zeros("baz", shape=10)
+    z.attrs["spam"] = ["eggs"]
+    assert z.attrs["spam"] == ("eggs",)
+    g.create_group("qux")
+    for name in ["baz", "qux"]:
+        assert g[name].attrs.frozen
+    assert pickle.loads(pickle.dumps(g)).attrs.frozen
+    assert pickle.loads(pickle.dumps(z)).attrs.frozen
+
+    z = zeros(10, freeze_attrs=True)
+    z.attrs["spam"] = ["eggs"]
+    assert z.attrs["spam"] == ("eggs",)
+    z = open_array(z.store, freeze_attrs=True)
+    assert z.attrs["spam"] == ("eggs",)
+    assert not zeros(10).attrs.frozen
+
+
+def test_copy_from_frozen():
+    from zarr.v2.convenience import copy, copy_all
+
+    src = group(freeze_attrs=True)
+    src.attrs["foo"] = {"bar": [1, 2]}
+    src.zeros("baz", shape=10).attrs["spam"] = ["eggs"]
+
+    # frozen values are written as plain JSON to a destination that is not frozen
+    dst = group()
+    copy_all(src, dst)
+    assert dst.attrs.asdict() == {"foo": {"bar": [1, 2]}}
+    assert dst["baz"].attrs["spam"] == ["eggs"]
+    dst = group()
+    copy(src["baz"], dst)
+    assert dst["baz"].attrs["spam"] == ["eggs"]
+    dst.attrs["foo"] = src.attrs["foo"]
+    assert dst.attrs["foo"] == {"bar": [1, 2]}
@@ -492,7 +492,7 @@ class StoreTests:
         assert default_compressor.get_config() == meta["compressor"]
         assert meta["fill_value"] is None
         # Missing MUST be assumed to be "."
-        assert meta.get("dimension_separator", ".") is want_dim_sep
+        assert meta.get("dimension_separator", ".") == want_dim_sep
 
         store.close()
 
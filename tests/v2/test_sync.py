@@ -7,6 +7,7 @@ from multiprocessing.pool import ThreadPool
 from tempfile import mkdtemp
 
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 from zarr.v2.attrs import Attributes
@@ -29,6 +30,12 @@ class TestAttributesWithThreadSynchronizer(TestAttributes):
             store, synchronizer=synchronizer, key=key, read_only=read_only, cache=cache
         )
 
+    def test_bulk(self):
+        a = self.init_attributes(dict())
+        with pytest.raises(ValueError):
+            with a.bulk():
+                pass
+
 
 class TestAttributesProcessSynchronizer(TestAttributes):
     def init_attributes(self, store, read_only=False, cache=True):
@@ -40,6 +47,12 @@ class TestAttributesProcessSynchronizer(TestAttributes):
             store, synchronizer=synchronizer, key=key, read_only=read_only, cache=cache
         )
 
+    def test_bulk(self):
+        a = self.init_attributes(dict())
+        with pytest.raises(ValueError):
+            with a.bulk():
+                pass
+
 
 def _append(arg):
     z, i = arg
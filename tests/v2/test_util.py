@@ -1,3 +1,4 @@
+import json
 import re
 from unittest import mock
 
@@ -7,6 +8,7 @@ import pytest
 from zarr.v2.core import Array
 from zarr.v2.util import (
     ConstantMap,
+    NumberEncoder,
     all_equal,
     flatten,
     guess_chunks,
@@ -15,6 +17,7 @@ from zarr.v2.util import (
     info_text_report,
     is_total_slice,
     json_dumps,
+    json_loads,
     normalize_chunks,
     normalize_dimension_separator,
     normalize_fill_value,
@@ -279,6 +282,51 @@ def test_json_dumps_numpy_dtype():
         json_dumps(Array)
 
 
+@pytest.mark.parametrize(
+    "o",
+    [
+        {"foo": "bar", "baz": 42},
+        {"a": 1.5, "b": float("nan"), "c": float("inf"), "d": -float("inf"), "e": 2**70},
+        {"t": True, "f": False, "n": None, 'q"\u00e9': "\u00fc\n", "": ""},
+        {"i": np.int64(1), "f": np.float32(0.5)},
+        {"nested": {"foo": [1, 2]}},
+        {1: "foo", 2: "bar"},
+        {},
+        [1, "foo"],
+    ],
+)
+def test_json_dumps_matches_stdlib(o):
+    expected = json.dumps(
+        o, indent=4, sort_keys=True, ensure_ascii=True, separators=(",", ": "), cls=NumberEncoder
+    )
+    assert json_dumps(o) == expected.encode("ascii")
+
+
+def test_json_dumps_large():
+    # large enough to be encoded in several batches
+    o = {"foo": [{"bar": i, "baz": [i, 2.5, "é"]} for i in range(5000)], "a": None}
+    expected = json.dumps(o, indent=4, sort_keys=True, ensure_ascii=True, separators=(",", ": "))
+    assert json_dumps(o) == expected.encode("ascii")
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_json_loads(use_orjson, monkeypatch):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("zarr.v2.util.orjson", None)
+    assert json_loads(b'{"foo": [1, 2.5, "bar"]}') == {"foo": [1, 2.5, "bar"]}
+    assert json_loads('{"foo": null}') == {"foo": None}
+    # other buffer types stores may return
+    b = b'{"foo": "b\xc3\xa4r"}'
+    for s in (bytearray(b), memoryview(b), np.frombuffer(b, dtype="u1")):
+        assert json_loads(s) == {"foo": "b\u00e4r"}
+    # values only the stdlib parser accepts
+    nan = json_loads(b'{"foo": NaN}')["foo"]
+    assert nan != nan
+    assert json_loads(b'{"foo": 18446744073709551616}') == {"foo": 2**64}
+
+
 def test_constant_map():
     val = object()
     m = ConstantMap(keys=[1, 2], constant=val)
@@ -12,6 +12,8 @@ import zarr.v2
 from zarr.abc.codec import Codec
 from zarr.abc.store import Store
 from zarr.array import Array, AsyncArray
+from zarr.array_spec import ArraySpec
+from zarr.buffer import default_buffer_prototype
 from zarr.codecs import (
     BloscCodec,
     BytesCodec,
@@ -21,6 +23,7 @@ from zarr.codecs import (
     TransposeCodec,
     ZstdCodec,
 )
+from zarr.codecs.sharding import _ShardIndex
 from zarr.config import config
 from zarr.indexing import Selection, morton_order_iter
 from zarr.store import MemoryStore, StorePath
@@ -1047,3 +1050,34 @@ def test_update_attributes_array(store: Store):
 
     a = Array.open(store / "update_attributes")
     assert a.attrs["hello"] == "zarrita"
+
+
+def test_shard_index_is_dense() -> None:
+    index = _ShardIndex.create_empty((2, 2))
+    assert index.is_dense(8)
+    for i, chunk_coords in enumerate([(0, 0), (0, 1), (1, 1)]):
+        index.set_chunk_slice(chunk_coords, slice(i * 8, (i + 1) * 8))
+    assert index.is_dense(8)
+    assert not index.is_dense(16)
+
+    # two chunks sharing an offset
+    index.set_chunk_slice((1, 0), slice(0, 8))
+    assert not index.is_dense(8)
+
+
+def test_sharding_evolve_identity() -> None:
+    spec = ArraySpec(
+        shape=(16,),
+        dtype=np.dtype("uint16"),
+        fill_value=0,
+        order="C",
+        prototype=default_buffer_prototype,
+    )
+    codec = ShardingCodec(chunk_shape=(8,), codecs=[BytesCodec(endian="little")])
+    assert codec.evolve_from_array_spec(spec) is codec
+
+    codec = ShardingCodec(chunk_shape=(8,), codecs=[BytesCodec(endian="little"), BloscCodec()])
+    evolved = codec.evolve_from_array_spec(spec)
+    assert evolved is not codec
+    assert evolved.codecs[0] is codec.codecs[0]
+    assert evolved.codecs[1].typesize == 2
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
 import numpy as np
 import pytest
 
-from zarr.common import parse_name, parse_shapelike, product
+from zarr.common import parse_dtype, parse_name, parse_shapelike, product
 from zarr.config import parse_indexing_order
 
 
@@ -109,10 +109,22 @@ def test_parse_shapelike_valid(data: Iterable[int]) -> None:
 
 # todo: more dtypes
 @pytest.mark.parametrize("data", [("uint8", np.uint8), ("float64", np.float64)])
-def parse_dtype(data: tuple[str, np.dtype]) -> None:
+def test_parse_dtype(data: tuple[str, np.dtype]) -> None:
     unparsed, parsed = data
     assert parse_dtype(unparsed) == parsed
 
 
+def test_parse_dtype_unhashable() -> None:
+    fields = [("a", "<i4"), ("b", "<f8")]
+    assert parse_dtype(fields) == np.dtype(fields)
+
+
+def test_parse_dtype_invalid() -> None:
+    # the error of np.dtype is raised as is, not while handling a cache miss
+    with pytest.raises(TypeError) as excinfo:
+        parse_dtype("foo")
+    assert excinfo.value.__context__ is None
+
+
 # todo: figure out what it means to test this
 def test_parse_fill_value() -> None: ...
@@ -30,3 +30,39 @@ def test_config_defaults_can_be_overridden(key: str, old_val: Any, new_val: Any)
     assert config.get(key) == old_val
     with config.set({key: new_val}):
         assert config.get(key) == new_val
+
+
+def test_config_cached_get_invalidation(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert config.cached_get("json_indent") == 2
+    with config.set({"json_indent": 0}):
+        assert config.cached_get("json_indent") == 0
+    assert config.cached_get("json_indent") == 2
+
+    config.set({"json_indent": 4})
+    assert config.cached_get("json_indent") == 4
+    config.refresh()
+    assert config.cached_get("json_indent") == 2
+
+    config.merge({"json_indent": 6})
+    assert config.cached_get("json_indent") == 6
+    config.refresh()
+
+    monkeypatch.setenv("ZI", "7")
+    config.set({"json_indent": "$ZI"})
+    assert config.cached_get("json_indent") == "$ZI"
+    config.expand_environment_variables()
+    assert config.cached_get("json_indent") == "7"
+    config.refresh()
+    assert config.cached_get("json_indent") == 2
+
+
+def test_config_defaults_read_only() -> None:
+    with pytest.raises(TypeError):
+        config.defaults[0]["json_indent"] = 4
+    with pytest.raises(TypeError):
+        config.defaults[0]["array"]["order"] = "F"
+    # the active configuration is still writable
+    with config.set({"array.order": "F"}):
+        assert config.get("array.order") == "F"
+    config.refresh()
+    assert config.get("array.order") == "C"
@@ -1,18 +1,44 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
+import numcodecs
+import numpy as np
 import pytest
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from typing import Any
 
-from zarr.metadata import parse_dimension_names, parse_zarr_format_v2, parse_zarr_format_v3
-
-
-# todo: test
-def test_datatype_enum(): ...
+import zarr.metadata
+from zarr.chunk_grids import ChunkGrid
+from zarr.chunk_key_encodings import (
+    ChunkKeyEncoding,
+    DefaultChunkKeyEncoding,
+    V2ChunkKeyEncoding,
+)
+from zarr.common import ZARR_JSON
+from zarr.config import config
+from zarr.indexing import Order
+from zarr.metadata import (
+    ArrayV3Metadata,
+    DataType,
+    V3JsonEncoder,
+    _orjson_can_encode,
+    parse_dimension_names,
+    parse_zarr_format_v2,
+    parse_zarr_format_v3,
+)
+
+
+@pytest.mark.parametrize("dtype", ["bool", "int8", "uint16", "int32", "uint64", "float32"])
+def test_datatype_from_dtype(dtype: str) -> None:
+    data_type = DataType.from_dtype(np.dtype(dtype))
+    assert data_type == DataType[dtype]
+    assert data_type.value == dtype
+    assert data_type.byte_count == np.dtype(dtype).itemsize
+    assert np.dtype(data_type.to_numpy_shortname()) == np.dtype(dtype)
 
 
 # todo: test
@@ -25,14 +51,18 @@ def test_array_metadata_v3(): ...
 def test_array_metadata_v2(): ...
 
 
-@pytest.mark.parametrize("data", [None, ("a", "b", "c"), ["a", "a", "a"]])
-def parse_dimension_names_valid(data: Sequence[str] | None) -> None:
+@pytest.mark.parametrize("data", [None, (), ("a", "b", "c"), ("a", None, "a")])
+def test_parse_dimension_names_valid(data: Sequence[str | None] | None) -> None:
     assert parse_dimension_names(data) == data
 
 
-@pytest.mark.parametrize("data", [(), [1, 2, "a"], {"foo": 10}])
-def parse_dimension_names_invalid(data: Any) -> None:
-    with pytest.raises(TypeError, match="Expected either None or iterable of str,"):
+def test_parse_dimension_names_iterator() -> None:
+    assert parse_dimension_names(iter(["a", None])) == ("a", None)
+
+
+@pytest.mark.parametrize("data", [10, [1, 2, "a"], ("a", 1.0)])
+def test_parse_dimension_names_invalid(data: Any) -> None:
+    with pytest.raises(TypeError, match="Expected either None or a iterable of str or None,"):
         parse_dimension_names(data)
 
 
@@ -58,3 +88,143 @@ def test_parse_zarr_format_v2_valid() -> None:
 def test_parse_zarr_foramt_v2_invalid(data: Any) -> None:
     with pytest.raises(ValueError, match=f"Invalid value. Expected 2. Got {data}"):
         parse_zarr_format_v2(data)
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def use_orjson(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(zarr.metadata, "_HAS_ORJSON", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("fill_value", [np.nan, np.inf, -np.inf])
+def test_array_metadata_v3_special_float_fill_value(fill_value: float, use_orjson: bool) -> None:
+    metadata = ArrayV3Metadata(
+        shape=(4,),
+        data_type="float64",
+        chunk_grid={"name": "regular", "configuration": {"chunk_shape": (2,)}},
+        chunk_key_encoding={"name": "default", "configuration": {"separator": "/"}},
+        fill_value=fill_value,
+        codecs=[{"name": "bytes", "configuration": {"endian": "little"}}],
+        attributes={"foo": [fill_value, 1.5]},
+        dimension_names=None,
+    )
+    document = metadata.to_buffer_dict()[ZARR_JSON].to_bytes()
+    parsed = json.loads(document)
+    expected = {np.inf: "Infinity", -np.inf: "-Infinity"}.get(fill_value, "NaN")
+    assert parsed["fill_value"] == expected
+    # only the fill value uses the string encoding, attributes keep their floats, as for groups
+    np.testing.assert_equal(parsed["attributes"], {"foo": [fill_value, 1.5]})
+
+    roundtripped = ArrayV3Metadata.from_dict(parsed)
+    np.testing.assert_equal(roundtripped.fill_value, fill_value)
+    np.testing.assert_equal(roundtripped.attributes, {"foo": [fill_value, 1.5]})
+
+
+def test_orjson_can_encode() -> None:
+    assert _orjson_can_encode({"foo": [1, 2.5, None, "bar", (DataType.int8,)]})
+    assert not _orjson_can_encode({"foo": {"bar": [1, (np.float32("nan"),)]}})
+    assert not _orjson_can_encode({"foo": float("-inf")})
+    # orjson would write the value of this enum, not its name
+    assert not _orjson_can_encode({"foo": Order.INCREASING})
+    # nesting deeper than the recursion limit
+    deep: list[Any] = [float("inf")]
+    for _ in range(10_000):
+        deep = [deep]
+    assert not _orjson_can_encode(deep)
+
+
+def test_v3_json_encoder_default() -> None:
+    data = {
+        "dtype": np.dtype("uint16"),
+        "scalars": [np.int64(3), np.float32(0.5), np.bool_(True), np.float32("nan")],
+        "enum": DataType.int8,
+        "numcodecs": numcodecs.Zlib(level=1),
+    }
+    encoded = json.loads(json.dumps(data, cls=V3JsonEncoder))
+    np.testing.assert_equal(
+        encoded,
+        {
+            "dtype": "uint16",
+            "scalars": [3, 0.5, True, np.nan],
+            "enum": "int8",
+            "numcodecs": {"id": "zlib", "level": 1},
+        },
+    )
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        json.dumps({"foo": object()}, cls=V3JsonEncoder)
+
+
+@pytest.mark.parametrize("json_indent", [None, 0, 2, 4])
+def test_array_metadata_v3_to_buffer_dict(json_indent: int | None, use_orjson: bool) -> None:
+    metadata = ArrayV3Metadata(
+        shape=(4, 4),
+        data_type="uint8",
+        chunk_grid={"name": "regular", "configuration": {"chunk_shape": (2, 2)}},
+        chunk_key_encoding={"name": "v2", "configuration": {"separator": "."}},
+        fill_value=np.uint8(3),
+        codecs=[
+            {"name": "bytes", "configuration": {"endian": "little"}},
+            {"name": "blosc", "configuration": {"cname": "zstd", "shuffle": "bitshuffle"}},
+        ],
+        attributes={"foo": {"bar": [1, 2.5, None, "baz"]}, "qux": (np.float32(-0.5),)},
+        dimension_names=("x", "y"),
+    )
+    with config.set({"json_indent": json_indent}):
+        document = metadata.to_buffer_dict()[ZARR_JSON].to_bytes()
+    assert json.loads(document) == {
+        "zarr_format": 3,
+        "node_type": "array",
+        "shape": [4, 4],
+        "data_type": "uint8",
+        "chunk_grid": {"name": "regular", "configuration": {"chunk_shape": [2, 2]}},
+        "chunk_key_encoding": {"name": "v2", "configuration": {"separator": "."}},
+        "fill_value": 3,
+        "codecs": [
+            {"name": "bytes", "configuration": {"endian": "little"}},
+            {
+                "name": "blosc",
+                "configuration": {
+                    "typesize": 1,
+                    "cname": "zstd",
+                    "clevel": 5,
+                    "shuffle": "bitshuffle",
+                    "blocksize": 0,
+                },
+            },
+        ],
+        "attributes": {"foo": {"bar": [1, 2.5, None, "baz"]}, "qux": [-0.5]},
+        "dimension_names": ["x", "y"],
+    }
+
+
+def test_array_metadata_v3_slots() -> None:
+    metadata = ArrayV3Metadata(
+        shape=(4,),
+        data_type="uint8",
+        chunk_grid={"name": "regular", "configuration": {"chunk_shape": (2,)}},
+        chunk_key_encoding={"name": "default", "configuration": {"separator": "/"}},
+        fill_value=0,
+        codecs=[{"name": "bytes"}],
+        attributes=None,
+        dimension_names=None,
+    )
+    assert not hasattr(metadata, "__dict__")
+    assert (metadata.zarr_format, metadata.node_type) == (3, "array")
+    assert metadata.update_shape((8,)).shape == (8,)
+
+
+def test_chunk_grid_and_chunk_key_encoding_interned() -> None:
+    chunk_grid = {"name": "regular", "configuration": {"chunk_shape": [2, 2]}}
+    assert ChunkGrid.from_dict(chunk_grid) is ChunkGrid.from_dict(dict(chunk_grid))
+    assert ChunkGrid.from_dict(chunk_grid) is not ChunkGrid.from_dict(
+        {"name": "regular", "configuration": {"chunk_shape": [2, 4]}}
+    )
+
+    chunk_key_encoding = {"name": "default", "configuration": {"separator": "/"}}
+    encoding = ChunkKeyEncoding.from_dict(chunk_key_encoding)
+    assert ChunkKeyEncoding.from_dict(dict(chunk_key_encoding)) is encoding
+    assert isinstance(encoding, DefaultChunkKeyEncoding)
+    v2_encoding = ChunkKeyEncoding.from_dict({"name": "v2", "configuration": {"separator": "/"}})
+    assert isinstance(v2_encoding, V2ChunkKeyEncoding)